@@ -1,21 +1,16 @@
 import Papa from 'papaparse';
 import type { Game, Roster, ScoringSettings } from '../types';
 
-// Sleeper player type for all NBA players
+// Sleeper player type for all NBA players (fields kept by the refresh script)
 export interface SleeperPlayer {
-  player_id: string;
-  full_name: string;
   first_name: string;
   last_name: string;
   team: string | null;
   position: string;
   fantasy_positions: string[];
-  status: string;
   active: boolean;
   injury_status: string | null;
   search_rank: number | null;
-  age: number;
-  years_exp: number;
 }
 
 export async function loadGames(): Promise<Game[]> {
@@ -0,0 +1,67 @@
+"""
+Shared HTTP plumbing for the SLEEPR refresh scripts.
+
+A single module-level requests.Session is reused for every Sleeper / NBA call
+so keep-alive connections are pooled per host instead of paying a fresh
+TCP+TLS handshake on each request.
+"""
+
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_TIMEOUT = 30  # seconds
+
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20))
+SESSION.headers.update({"User-Agent": "sleepr-refresh/1.0"})
+
+
+class TokenBucket:
+    """Thread-safe token bucket whose rate adapts to server pushback (AIMD).
+
+    Starts at (and never exceeds) `rate` requests per second with up to `burst`
+    requests back to back. on_throttle() halves the rate, down to min_rate;
+    each on_success() adds `increase` back.
+    """
+
+    def __init__(self, rate: float = 2.0, burst: int = 4, min_rate: float = 0.5, increase: float = 0.1):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.increase = increase
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def acquire(self):
+        """Block until a request slot is available."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def on_success(self):
+        """Additive increase after a request went through."""
+        with self._lock:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self):
+        """Multiplicative decrease after a timeout / 429, dropping any saved-up burst."""
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0.0
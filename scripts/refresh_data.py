@@ -9,17 +9,36 @@ Usage:
     python3 refresh_data.py --free-agents # Include top 100 free agents
 
 Requirements:
-    pip install requests pandas nba_api
+    pip install requests pandas nba_api orjson
+    pip install brotli  # optional, for .br sidecars
 """
 
-import json
-import requests
-import pandas as pd
+import orjson
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 import time
 import sys
 import argparse
+import gzip
+import hashlib
+import shutil
+from functools import lru_cache
+from typing import NamedTuple, TYPE_CHECKING
+
+from requests.exceptions import Timeout
+
+from _http import SESSION, DEFAULT_TIMEOUT, TokenBucket
+
+# pandas / numpy are imported inside the functions that use them, so
+# quick_refresh can reuse the Sleeper helpers here without loading them
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import brotli  # Optional: enables .br sidecars next to the .gz ones
+except ImportError:
+    brotli = None
 
 # Configuration
 LEAGUE_ID = "1284738635970666496"  # Your Sleeper league ID (NBA LOCK IN 15K FINAL)
@@ -27,12 +46,70 @@ SEASON = "2025-26"  # NBA season
 SEASON_START = datetime(2025, 10, 21)  # 2025-26 season start date (October 21, 2025)
 DATA_DIR = Path(__file__).parent.parent / "data"
 DASHBOARD_PUBLIC = Path(__file__).parent.parent / "dashboard" / "public"
+GAMELOG_CACHE_DIR = DATA_DIR / "gamelog_cache" / SEASON  # One JSON file per NBA player ID
+# Cache mtimes are local dates but game dates are US Eastern, so request windows
+# start this long before the last check (a game still live at midnight, or a
+# clock ahead of ET, would otherwise stamp its day as checked before it's final)
+GAMELOG_RECHECK_MARGIN = timedelta(days=1)
+SLEEPER_CACHE_DIR = DATA_DIR / "sleeper_cache"  # Raw players/nba payload, HTTP validators + all_players.json build stamp
+GAME_SHARDS_DIR = DASHBOARD_PUBLIC / "games"  # One games CSV per Sleeper player ID
+
+# Column order of games.csv
+GAME_COLUMNS = [
+    "player", "sleeper_id", "nba_team", "fantasy_team", "date", "week", "matchup",
+    "minutes", "fpts", "fpts_per_min", "pts", "reb", "ast", "stl", "blk", "tov",
+    "fgm", "fga", "fg_pct", "ftm", "fta", "fg3m",
+]
+# games.csv stat columns and the NBA Stats API field each one comes from
+GAME_STAT_COLUMNS = {
+    "pts": "PTS", "reb": "REB", "ast": "AST", "stl": "STL", "blk": "BLK", "tov": "TOV",
+    "fgm": "FGM", "fga": "FGA", "fg_pct": "FG_PCT", "ftm": "FTM", "fta": "FTA", "fg3m": "FG3M",
+}
+# Explicit dtypes for the games DataFrame; repetitive strings are categoricals
+GAME_DTYPES = {
+    "player": "category", "nba_team": "category", "fantasy_team": "category", "matchup": "category",
+    "week": "int8", "fg_pct": "float64",
+    **{col: "int16" for col in GAME_STAT_COLUMNS if col != "fg_pct"},
+}
+
+# Sleeper player fields written to all_players.json (the only ones the dashboard reads)
+ALL_PLAYERS_FIELDS = (
+    "first_name", "last_name", "team", "position", "fantasy_positions",
+    "injury_status", "active", "search_rank",
+)
 
 # Sleeper API endpoints
 SLEEPER_BASE = "https://api.sleeper.app/v1"
 
+# NBA Stats API endpoints (queried directly through the shared session)
+NBA_STATS_BASE = "https://stats.nba.com/stats"
+NBA_STATS_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) "
+                  "Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "application/json, text/plain, */*",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Origin": "https://www.nba.com",
+    "Referer": "https://www.nba.com/",
+    "x-nba-stats-origin": "stats",
+    "x-nba-stats-token": "true",
+}
+
+# NBA Stats API throttling (shared by all gamelog worker threads)
+NBA_MAX_WORKERS = 4
+NBA_MAX_RETRIES = 3
+_nba_token_bucket = TokenBucket(rate=2.0, burst=4)
+
 # Cache for NBA player lookups
 _nba_players_cache = None
+_nba_name_index = None
+
+
+class NameIndex(NamedTuple):
+    """Lookup tables from normalized player names to NBA player IDs."""
+    exact: dict       # "full name" -> id
+    clean: dict       # full name without Jr/Sr/II/III/IV suffixes -> id
+    last_first: dict  # (last name, first initial) -> id, active players only
+    by_id: dict       # id -> lowercased full name
 
 
 def log(message: str):
@@ -41,12 +118,37 @@ def log(message: str):
     print(f"[{timestamp}] {message}")
 
 
+def write_json(path: Path, data, indent: bool = False, precompress: bool = False):
+    """Serialize data with orjson and write it to path.
+
+    Only pass indent=True for files a human is likely to read; the large
+    machine-consumed outputs are written compact. With precompress=True,
+    .gz (and, if brotli is installed, .br) sidecars are written too so a
+    static server can send them without compressing at request time.
+    """
+    option = orjson.OPT_NON_STR_KEYS  # matchups are keyed by int matchup_id
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    body = orjson.dumps(data, option=option)
+    path.write_bytes(body)
+
+    if precompress:
+        Path(f"{path}.gz").write_bytes(gzip.compress(body, compresslevel=9, mtime=0))
+        br_path = Path(f"{path}.br")
+        if brotli is not None:
+            br_path.write_bytes(brotli.compress(body, quality=11))
+        else:
+            br_path.unlink(missing_ok=True)  # never leave a stale .br behind
+
+
 def fetch_nba_schedule() -> dict:
     """Fetch NBA schedule from CDN endpoint."""
+    import pandas as pd
+
     log("Fetching NBA schedule...")
     url = "https://cdn.nba.com/static/json/staticData/scheduleLeagueV2.json"
     headers = {"User-Agent": "Mozilla/5.0"}
-    response = requests.get(url, headers=headers, timeout=30)
+    response = SESSION.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
     response.raise_for_status()
     data = response.json()
 
@@ -54,17 +156,10 @@ def fetch_nba_schedule() -> dict:
     schedule = data.get("leagueSchedule", {})
     game_dates = schedule.get("gameDates", [])
 
-    # Build team schedule: {team_code: [{date, opponent, home}]}
-    team_schedules = {}
-    today = datetime.now()
-
+    # Flatten to one row per team per game (home team first, then away team)
+    records = []
     for gd in game_dates:
         date_str = gd.get("gameDate", "")
-        try:
-            game_date = datetime.strptime(date_str, "%m/%d/%Y %H:%M:%S")
-        except ValueError:
-            continue
-
         for game in gd.get("games", []):
             home_team = game.get("homeTeam", {}).get("teamTricode", "")
             away_team = game.get("awayTeam", {}).get("teamTricode", "")
@@ -73,41 +168,42 @@ def fetch_nba_schedule() -> dict:
             if not home_team or not away_team:
                 continue
 
-            # Add to home team schedule
-            if home_team not in team_schedules:
-                team_schedules[home_team] = []
-            team_schedules[home_team].append({
-                "date": game_date.strftime("%Y-%m-%d"),
-                "opponent": away_team,
-                "home": True,
-                "time": game_time,
-            })
+            records.append((home_team, date_str, away_team, True, game_time))
+            records.append((away_team, date_str, home_team, False, game_time))
 
-            # Add to away team schedule
-            if away_team not in team_schedules:
-                team_schedules[away_team] = []
-            team_schedules[away_team].append({
-                "date": game_date.strftime("%Y-%m-%d"),
-                "opponent": home_team,
-                "home": False,
-                "time": game_time,
-            })
+    games = pd.DataFrame(records, columns=["team", "date", "opponent", "home", "time"])
+
+    # Parse every game date in one vectorized pass; unparseable dates are dropped
+    games["date"] = pd.to_datetime(games["date"], format="%m/%d/%Y %H:%M:%S", errors="coerce", cache=True)
+    games = games.dropna(subset=["date"])
+    games["date"] = games["date"].dt.strftime("%Y-%m-%d")
 
     # Calculate remaining games this week for each team
     # Week ends on Sunday
+    today = datetime.now()
     today_weekday = today.weekday()  # Monday=0, Sunday=6
     days_until_sunday = (6 - today_weekday) % 7 + 1 if today_weekday != 6 else 7
     week_end = today + timedelta(days=days_until_sunday)
-
-    remaining_this_week = {}
-    for team, games in team_schedules.items():
-        remaining = [g for g in games if today.strftime("%Y-%m-%d") <= g["date"] <= week_end.strftime("%Y-%m-%d")]
-        remaining_this_week[team] = remaining
+    today_str = today.strftime("%Y-%m-%d")
+    week_end_str = week_end.strftime("%Y-%m-%d")
+    remaining = games[(games["date"] >= today_str) & (games["date"] <= week_end_str)]
+
+    # Build team schedule: {team_code: [{date, opponent, home, time}]}
+    columns = ["date", "opponent", "home", "time"]
+    team_schedules = {
+        team: team_games[columns].to_dict("records")
+        for team, team_games in games.groupby("team", sort=False)
+    }
+    remaining_by_team = {
+        team: team_games[columns].to_dict("records")
+        for team, team_games in remaining.groupby("team", sort=False)
+    }
+    remaining_this_week = {team: remaining_by_team.get(team, []) for team in team_schedules}
 
     return {
         "season": schedule.get("seasonYear", ""),
         "lastUpdated": today.isoformat(),
-        "weekEnd": week_end.strftime("%Y-%m-%d"),
+        "weekEnd": week_end_str,
         "teamSchedules": team_schedules,
         "remainingThisWeek": remaining_this_week,
     }
@@ -117,7 +213,7 @@ def fetch_sleeper_rosters() -> list:
     """Fetch current rosters from Sleeper API."""
     log("Fetching rosters from Sleeper API...")
     url = f"{SLEEPER_BASE}/league/{LEAGUE_ID}/rosters"
-    response = requests.get(url)
+    response = SESSION.get(url, timeout=DEFAULT_TIMEOUT)
     response.raise_for_status()
     return response.json()
 
@@ -126,7 +222,7 @@ def fetch_sleeper_users() -> dict:
     """Fetch league users from Sleeper API."""
     log("Fetching users from Sleeper API...")
     url = f"{SLEEPER_BASE}/league/{LEAGUE_ID}/users"
-    response = requests.get(url)
+    response = SESSION.get(url, timeout=DEFAULT_TIMEOUT)
     response.raise_for_status()
     users = response.json()
     return {u["user_id"]: u for u in users}
@@ -136,7 +232,7 @@ def fetch_sleeper_league() -> dict:
     """Fetch league info from Sleeper API."""
     log("Fetching league info from Sleeper API...")
     url = f"{SLEEPER_BASE}/league/{LEAGUE_ID}"
-    response = requests.get(url)
+    response = SESSION.get(url, timeout=DEFAULT_TIMEOUT)
     response.raise_for_status()
     return response.json()
 
@@ -144,7 +240,7 @@ def fetch_sleeper_league() -> dict:
 def fetch_sleeper_matchups(week: int) -> list:
     """Fetch matchups for a given week from Sleeper API."""
     url = f"{SLEEPER_BASE}/league/{LEAGUE_ID}/matchups/{week}"
-    response = requests.get(url)
+    response = SESSION.get(url, timeout=DEFAULT_TIMEOUT)
     response.raise_for_status()
     return response.json()
 
@@ -177,13 +273,81 @@ def fetch_all_matchups(max_week: int) -> dict:
     return all_matchups
 
 
-def fetch_sleeper_all_players() -> dict:
-    """Fetch ALL NBA players from Sleeper API."""
+def fetch_sleeper_all_players() -> tuple:
+    """Fetch ALL NBA players from Sleeper API.
+
+    The raw payload is cached on disk and revalidated with a conditional GET
+    (If-None-Match / If-Modified-Since). Returns (players, digest), where
+    digest is the sha256 of the raw payload; save_all_players() uses it to
+    tell whether all_players.json is already built from this payload.
+    """
     log("Fetching all NBA players from Sleeper API...")
     url = f"{SLEEPER_BASE}/players/nba"
-    response = requests.get(url)
+    body_path = SLEEPER_CACHE_DIR / "players_nba.json"
+    validators_path = SLEEPER_CACHE_DIR / "players_nba.validators.json"
+
+    cached = body_path.read_bytes() if body_path.exists() else None
+    headers = {}
+    if cached is not None and validators_path.exists():
+        validators = orjson.loads(validators_path.read_bytes())
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    response = SESSION.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
+    if response.status_code == 304 and cached is not None:
+        log("  Players not modified since last refresh, using cached copy")
+        return orjson.loads(cached), hashlib.sha256(cached).hexdigest()
     response.raise_for_status()
-    return response.json()
+
+    body = response.content
+    SLEEPER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    if body != cached:
+        body_path.write_bytes(body)
+    write_json(validators_path, {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    })
+    return orjson.loads(body), hashlib.sha256(body).hexdigest()
+
+
+def save_all_players(nba_players: dict, digest: str):
+    """Write all_players.json (for free agent lookup in frontend), pruned to
+    the fields the dashboard uses.
+
+    A build stamp records the payload digest, field list and sidecars the
+    file was written with, plus the sha256 of the file itself, and is
+    written last. The file is only rebuilt when the stamp doesn't match, so
+    a skipped or crashed write, a change to ALL_PLAYERS_FIELDS, a missing
+    .gz/.br sidecar or a file replaced on disk (all_players.json is tracked
+    in git, so a checkout can restore an old one) all trigger a rewrite on
+    the next run.
+    """
+    all_players_path = DASHBOARD_PUBLIC / "all_players.json"
+    stamp_path = SLEEPER_CACHE_DIR / "all_players.build.json"
+    stamp = {"sha256": digest, "fields": list(ALL_PLAYERS_FIELDS), "brotli": brotli is not None}
+
+    sidecars = [Path(f"{all_players_path}.gz")]
+    if brotli is not None:
+        sidecars.append(Path(f"{all_players_path}.br"))
+    if stamp_path.exists() and all_players_path.exists() and all(sidecar.exists() for sidecar in sidecars):
+        old_stamp = orjson.loads(stamp_path.read_bytes())
+        output_digest = old_stamp.pop("output_sha256", None)
+        if old_stamp == stamp and output_digest == hashlib.sha256(all_players_path.read_bytes()).hexdigest():
+            log(f"All NBA players unchanged, keeping {all_players_path}")
+            return
+
+    pruned_players = {
+        sleeper_id: {field: player.get(field) for field in ALL_PLAYERS_FIELDS}
+        for sleeper_id, player in nba_players.items()
+        if player.get("team") or player.get("active")
+    }
+    write_json(all_players_path, pruned_players, precompress=True)
+    stamp["output_sha256"] = hashlib.sha256(all_players_path.read_bytes()).hexdigest()
+    SLEEPER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    write_json(stamp_path, stamp)
+    log(f"Saved {len(pruned_players)} NBA players to {all_players_path}")
 
 
 def get_nba_players_list():
@@ -195,66 +359,326 @@ def get_nba_players_list():
     return _nba_players_cache
 
 
+def clean_player_name(name_lower: str) -> str:
+    """Strip Jr/Sr/II/III/IV suffixes from a lowercased player name."""
+    name_clean = name_lower.replace(' jr.', '').replace(' jr', '').replace(' sr.', '').replace(' sr', '')
+    return name_clean.replace(' iii', '').replace(' ii', '').replace(' iv', '').strip()
+
+
+def last_first_key(name_lower: str) -> tuple:
+    """(last name, first initial) key for a lowercased player name, or None."""
+    parts = name_lower.split()
+    if len(parts) < 2:
+        return None
+    return parts[-1], parts[0][0]
+
+
+def get_nba_name_index() -> NameIndex:
+    """Build name -> NBA player ID lookup tables in a single pass (cached).
+
+    The first matching player wins for every key, mirroring the order the
+    old linear scans checked them in.
+    """
+    global _nba_name_index
+    if _nba_name_index is None:
+        index = NameIndex(exact={}, clean={}, last_first={}, by_id={})
+        for p in get_nba_players_list():
+            full_lower = p['full_name'].lower()
+            index.by_id[p['id']] = full_lower
+            index.exact.setdefault(full_lower, p['id'])
+            index.clean.setdefault(clean_player_name(full_lower), p['id'])
+            key = last_first_key(full_lower)
+            if key and p.get('is_active', True):  # Prefer active players
+                index.last_first.setdefault(key, p['id'])
+        _nba_name_index = index
+    return _nba_name_index
+
+
+@lru_cache(maxsize=None)
 def find_nba_player_id(player_name: str, team: str = None) -> int:
     """Find NBA player ID by name using nba_api."""
-    nba_players = get_nba_players_list()
+    index = get_nba_name_index()
 
     # Normalize name for comparison
     name_lower = player_name.lower().strip()
 
-    # Try exact match first
-    for p in nba_players:
-        if p['full_name'].lower() == name_lower:
-            return p['id']
+    # Try exact match, then without Jr/Sr/III suffixes, then last name + first initial
+    return (
+        index.exact.get(name_lower)
+        or index.clean.get(clean_player_name(name_lower))
+        or index.last_first.get(last_first_key(name_lower))
+    )
 
-    # Try without Jr/Sr/III suffixes
-    name_clean = name_lower.replace(' jr.', '').replace(' jr', '').replace(' sr.', '').replace(' sr', '')
-    name_clean = name_clean.replace(' iii', '').replace(' ii', '').replace(' iv', '').strip()
 
-    for p in nba_players:
-        p_clean = p['full_name'].lower().replace(' jr.', '').replace(' jr', '').replace(' sr.', '').replace(' sr', '')
-        p_clean = p_clean.replace(' iii', '').replace(' ii', '').replace(' iv', '').strip()
-        if p_clean == name_clean:
-            return p['id']
+def parse_nba_result_set(payload: dict, index: int = 0) -> list:
+    """Turn an NBA Stats API resultSets entry into row dicts keyed by column header."""
+    result_set = payload["resultSets"][index]
+    headers = result_set["headers"]
+    return [dict(zip(headers, row)) for row in result_set["rowSet"]]
 
-    # Try last name + first initial match
-    parts = name_lower.split()
-    if len(parts) >= 2:
-        last_name = parts[-1]
-        first_initial = parts[0][0]
-        for p in nba_players:
-            p_parts = p['full_name'].lower().split()
-            if len(p_parts) >= 2:
-                if p_parts[-1] == last_name and p_parts[0][0] == first_initial:
-                    if p.get('is_active', True):  # Prefer active players
-                        return p['id']
 
+def request_nba_stats(endpoint: str, params: dict, description: str, timeout: int = DEFAULT_TIMEOUT) -> list:
+    """Request an NBA Stats API endpoint and return its first result set as row dicts.
+
+    Calls stats.nba.com directly (rather than through nba_api's endpoint
+    wrappers) so requests reuse the pooled keep-alive connections of the
+    shared session. Rows have the same shape as nba_api's normalized dict.
+    Returns None if the request failed, so callers can tell "no rows" apart
+    from "no answer".
+
+    Safe to call from worker threads: requests are throttled globally by
+    _nba_token_bucket, which slows down whenever a request times out or gets
+    a 429, and those are retried with exponential backoff.
+    """
+    for attempt in range(NBA_MAX_RETRIES):
+        _nba_token_bucket.acquire()
+        try:
+            response = SESSION.get(f"{NBA_STATS_BASE}/{endpoint}", params=params,
+                                   headers=NBA_STATS_HEADERS, timeout=timeout)
+            if response.status_code != 429:
+                response.raise_for_status()
+                _nba_token_bucket.on_success()
+                return parse_nba_result_set(response.json())
+        except Timeout:
+            pass
+        except Exception as e:
+            log(f"  Warning: Could not fetch {description}: {e}")
+            return None
+
+        # Timed out or rate limited: slow all workers down, then back off
+        _nba_token_bucket.on_throttle()
+        if attempt + 1 < NBA_MAX_RETRIES:
+            delay = 2 ** attempt
+            log(f"  Throttled fetching {description}, retrying in {delay}s...")
+            time.sleep(delay)
+
+    log(f"  Warning: Could not fetch {description}: throttled {NBA_MAX_RETRIES} times")
     return None
 
 
-def fetch_player_gamelog(player_id: int, player_name: str = "") -> list:
-    """Fetch game log for a player from NBA Stats API."""
+def request_player_gamelog(player_id: int, player_name: str = "", date_from: str = "") -> list:
+    """Request game log rows for a player from NBA Stats API.
+
+    date_from (MM/DD/YYYY) limits the response to games on or after that date.
+    Returns None if the request failed.
+    """
+    params = {
+        "PlayerID": player_id,
+        "Season": SEASON,
+        "SeasonType": "Regular Season",
+        "LeagueID": "00",
+        "DateFrom": date_from,
+        "DateTo": "",
+    }
+    return request_nba_stats("playergamelog", params, f"gamelog for {player_name} ({player_id})")
+
+
+@lru_cache(maxsize=512)
+def format_game_date(iso_date: str) -> str:
+    """Convert a LeagueGameLog date ("2025-10-22") to PlayerGameLog style ("OCT 22, 2025").
+
+    Memoized: thousands of rows share ~180 distinct game dates.
+    """
+    return datetime.strptime(iso_date, "%Y-%m-%d").strftime("%b %d, %Y").upper()
+
+
+def request_league_gamelog(date_from: str = "") -> list:
+    """Request every player's game log rows for the season in one LeagueGameLog call.
+
+    Rows are reshaped to match PlayerGameLog (Player_ID / Game_ID keys and
+    "OCT 22, 2025" style GAME_DATE). Returns None if the request failed.
+    """
+    params = {
+        "Counter": 0,  # nba_api LeagueGameLog default; no row cap
+        "DateFrom": date_from,
+        "DateTo": "",
+        "Direction": "ASC",
+        "LeagueID": "00",
+        "PlayerOrTeam": "P",
+        "Season": SEASON,
+        "SeasonType": "Regular Season",
+        "Sorter": "DATE",
+    }
+    rows = request_nba_stats("leaguegamelog", params, "league game log", timeout=DEFAULT_TIMEOUT * 2)
+    if rows is None:
+        return None
+
+    for row in rows:
+        row["Player_ID"] = row.pop("PLAYER_ID")
+        row["Game_ID"] = row.pop("GAME_ID")
+        row["GAME_DATE"] = format_game_date(row["GAME_DATE"])
+    return rows
+
+
+def fetch_league_gamelogs(player_ids: list) -> dict:
+    """Fetch new games for many players with a single LeagueGameLog request.
+
+    Requests everything since the oldest re-check window start among
+    player_ids' caches (see cached_gamelog_since; the whole season if any of
+    them has no cache yet, while an empty cache counts as checked). Returns
+    {player_id: rows} for the requested players that appear in the league
+    log, or None if the request failed.
+    """
+    # Only the cache files' mtimes are needed here; the workers parse them
+    since_dates = [cached_gamelog_since(player_id) for player_id in player_ids]
+    date_from = to_date_from(min(since_dates)) if since_dates and None not in since_dates else ""
+
+    log(f"  Fetching league game log{' since ' + date_from if date_from else ''}...")
+    rows = request_league_gamelog(date_from)
+    if rows is None:
+        return None
+
+    wanted = set(player_ids)
+    games_by_player = {}
+    for row in rows:
+        if row["Player_ID"] in wanted:
+            games_by_player.setdefault(row["Player_ID"], []).append(row)
+    log(f"  League game log: {len(rows)} rows, {len(games_by_player)}/{len(wanted)} requested players")
+    return games_by_player
+
+
+def load_cached_gamelog(player_id: int) -> list:
+    """Load a player's previously fetched game log from the disk cache.
+
+    Returns None when there is no (readable) cache, and [] for a player who
+    was checked but has no games yet.
+    """
+    cache_path = GAMELOG_CACHE_DIR / f"{player_id}.json"
+    if not cache_path.exists():
+        return None
     try:
-        from nba_api.stats.endpoints import playergamelog
-        gamelog = playergamelog.PlayerGameLog(
-            player_id=player_id,
-            season=SEASON,
-            season_type_all_star="Regular Season"
-        )
-        time.sleep(0.6)  # Rate limit to avoid getting blocked
-        return gamelog.get_normalized_dict()["PlayerGameLog"]
-    except Exception as e:
-        log(f"  Warning: Could not fetch gamelog for {player_name} ({player_id}): {e}")
-        return []
+        return orjson.loads(cache_path.read_bytes())
+    except (OSError, ValueError) as e:
+        log(f"  Warning: Ignoring unreadable gamelog cache {cache_path}: {e}")
+        return None
 
 
-def get_week_number(date_str: str) -> int:
-    """Calculate fantasy week number based on date."""
+def save_cached_gamelog(player_id: int, games: list):
+    """Write a player's full game log to the disk cache."""
+    GAMELOG_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    write_json(GAMELOG_CACHE_DIR / f"{player_id}.json", games)
+
+
+def nba_id_from_stats_id(stats_id, player_name: str) -> int:
+    """Use Sleeper's stats_id as the NBA player ID when it names the same player.
+
+    Returns None when the ID is missing, unknown to nba_api, or belongs to a
+    player whose last name / first initial don't match. Sleeper currently
+    sends stats_id as null for NBA players, so in practice every player falls
+    back to name matching; this only kicks in if Sleeper starts filling it.
+    """
     try:
-        date = datetime.strptime(date_str, "%b %d, %Y")
+        nba_id = int(stats_id)
+    except (TypeError, ValueError):
+        return None
+
+    nba_name = get_nba_name_index().by_id.get(nba_id)
+    if not nba_name:
+        return None
+    sleeper_key = last_first_key(clean_player_name(player_name.lower().strip()))
+    if sleeper_key and sleeper_key == last_first_key(clean_player_name(nba_name)):
+        return nba_id
+    return None
+
+
+def cached_gamelog_checked_on(player_id: int) -> str:
+    """Date (YYYY-MM-DD) a player's cached game log was last refreshed, or None.
+
+    The file mtime is the last-refresh timestamp: fetch_player_gamelog rewrites
+    or touches the cache after every successful check and leaves it alone when
+    the request fails. It is a local date, so callers compare against ET game
+    dates through cached_gamelog_since.
+    """
+    cache_path = GAMELOG_CACHE_DIR / f"{player_id}.json"
+    if not cache_path.exists():
+        return None
+    return datetime.fromtimestamp(cache_path.stat().st_mtime).strftime("%Y-%m-%d")
+
+
+def team_played_since(team_schedules: dict, team: str, since: str, today_str: str) -> bool:
+    """Whether an NBA team has a scheduled game between since and today_str (inclusive).
+
+    Team codes missing from the schedule count as having played, so those
+    players are always refreshed.
+    """
+    if team not in team_schedules:
+        return True
+    return any(since <= g["date"] <= today_str for g in team_schedules[team])
+
+
+def cached_gamelog_since(player_id: int) -> str:
+    """Start date (YYYY-MM-DD) of the window to re-check a cached game log, or None.
+
+    This is GAMELOG_RECHECK_MARGIN before the day the cache was last checked
+    rather than its last game, so players without recent games don't drag
+    the window back.
+    """
+    checked_on = cached_gamelog_checked_on(player_id)
+    if not checked_on:
+        return None
+    return (datetime.strptime(checked_on, "%Y-%m-%d") - GAMELOG_RECHECK_MARGIN).strftime("%Y-%m-%d")
+
+
+def to_date_from(since: str) -> str:
+    """Convert a YYYY-MM-DD date to NBA Stats API DateFrom format (MM/DD/YYYY)."""
+    return datetime.strptime(since, "%Y-%m-%d").strftime("%m/%d/%Y")
+
+
+def fetch_player_gamelog(player_id: int, player_name: str = "", refresh: bool = True,
+                         league_games: list = None) -> list:
+    """Fetch game log for a player, only requesting games since the cache was last checked.
+
+    The window starts a day before the last check so that games finished or
+    corrected after it replace the cached rows (matched on Game_ID). If
+    the request fails, the cached rows are returned unchanged. With
+    refresh=False the cached rows (possibly none) are returned without any
+    request (unless there is no cache yet).
+
+    league_games, when given, are this player's rows from fetch_league_gamelogs
+    and are merged instead of making a per-player request. A player with no
+    cache who is missing from the league log still gets a per-player request,
+    as does one whose cache is unreadable (the league log was only requested
+    from that file's mtime, so it may not cover the whole season).
+    """
+    cache_path = GAMELOG_CACHE_DIR / f"{player_id}.json"
+    cached = load_cached_gamelog(player_id)
+    if cached is not None and not refresh:
+        return cached
+
+    unreadable = cached is None and cache_path.exists()
+    if league_games is not None and not unreadable and (league_games or cached is not None):
+        new_games = league_games
+    else:
+        since = cached_gamelog_since(player_id) if cached is not None else None
+        date_from = to_date_from(since) if since else ""
+        new_games = request_player_gamelog(player_id, player_name, date_from)
+        if new_games is None:
+            return cached or []
+    if not new_games and cached is not None:
+        # Nothing new; bump the cache mtime so it counts as checked today
+        cache_path.touch()
+        return cached
+
+    merged = {g["Game_ID"]: g for g in cached or []}
+    merged.update((g["Game_ID"], g) for g in new_games)
+    games = sorted(merged.values(), key=lambda g: parse_game_date(g["GAME_DATE"]), reverse=True)
+    save_cached_gamelog(player_id, games)
+    return games
+
+
+def parse_game_date(date_str: str) -> datetime:
+    """Parse a game date as returned by NBA Stats API (e.g. "OCT 22, 2025")."""
+    try:
+        return datetime.strptime(date_str, "%b %d, %Y")
     except ValueError:
         # Try alternate format
-        date = datetime.strptime(date_str, "%Y-%m-%d")
+        return datetime.strptime(date_str, "%Y-%m-%d")
+
+
+@lru_cache(maxsize=512)
+def get_week_number(date_str: str) -> int:
+    """Calculate fantasy week number based on date (memoized: a season has ~180 game dates)."""
+    date = parse_game_date(date_str)
 
     # Find the Monday of the season start week
     start_monday = SEASON_START - timedelta(days=SEASON_START.weekday())
@@ -262,61 +686,74 @@ def get_week_number(date_str: str) -> int:
     return max(1, (days_diff // 7) + 1)
 
 
-def calculate_fpts(game: dict, scoring: dict) -> float:
-    """Calculate fantasy points based on scoring settings."""
-    fpts = 0.0
+def calculate_fpts(games: "pd.DataFrame", scoring: dict) -> "pd.Series":
+    """Calculate fantasy points for every game row based on scoring settings."""
+    import numpy as np
+    import pandas as pd
 
-    # Map Sleeper scoring keys to NBA API stat keys
+    # Map Sleeper scoring keys to games.csv stat columns
     stat_map = {
-        "pts": "PTS",
-        "reb": "REB",
-        "ast": "AST",
-        "stl": "STL",
-        "blk": "BLK",
-        "to": "TOV",      # Sleeper uses "to", NBA uses "TOV"
-        "fgm": "FGM",
-        "fga": "FGA",
-        "ftm": "FTM",
-        "fta": "FTA",
-        "tpm": "FG3M"     # Sleeper uses "tpm" for 3PM
+        "pts": "pts",
+        "reb": "reb",
+        "ast": "ast",
+        "stl": "stl",
+        "blk": "blk",
+        "to": "tov",      # Sleeper uses "to", NBA uses "TOV"
+        "fgm": "fgm",
+        "fga": "fga",
+        "ftm": "ftm",
+        "fta": "fta",
+        "tpm": "fg3m"     # Sleeper uses "tpm" for 3PM
     }
 
-    for sleeper_key, nba_key in stat_map.items():
-        if sleeper_key in scoring and nba_key in game:
-            fpts += scoring[sleeper_key] * (game[nba_key] or 0)
+    stats = games[list(stat_map.values())].fillna(0).astype(float)
+
+    # Accumulate one stat column at a time, in stat_map order, so every row
+    # sums in the same order (and to the same float) as a per-game loop would
+    fpts = np.zeros(len(stats))
+    for sleeper_key, col in stat_map.items():
+        if sleeper_key in scoring:
+            fpts += scoring[sleeper_key] * stats[col].to_numpy()
 
-    # Get raw stats for bonus calculations
-    pts = game.get("PTS", 0) or 0
-    reb = game.get("REB", 0) or 0
-    ast = game.get("AST", 0) or 0
-    stl = game.get("STL", 0) or 0
-    blk = game.get("BLK", 0) or 0
+    # Get raw stats for bonus calculations (as plain NumPy arrays)
+    core = stats[["pts", "reb", "ast", "stl", "blk"]].to_numpy()
+    pts, reb, ast = core[:, 0], core[:, 1], core[:, 2]
 
-    # Bonus scoring
+    # Look up bonus values once; bonuses the league doesn't score are skipped
+    bonus_pt_50p = scoring.get("bonus_pt_50p", 0)
+    bonus_pt_40p = scoring.get("bonus_pt_40p", 0)
+    bonus_reb_20p = scoring.get("bonus_reb_20p", 0)
+    bonus_ast_15p = scoring.get("bonus_ast_15p", 0)
+    dd = scoring.get("dd", 0)
+    td = scoring.get("td", 0)
+
+    # Bonus scoring (boolean masks times bonus value)
     # Points bonuses
-    if pts >= 50 and "bonus_pt_50p" in scoring:
-        fpts += scoring["bonus_pt_50p"]
-    if pts >= 40 and "bonus_pt_40p" in scoring:
-        fpts += scoring["bonus_pt_40p"]
+    if bonus_pt_50p:
+        fpts += (pts >= 50) * bonus_pt_50p
+    if bonus_pt_40p:
+        fpts += (pts >= 40) * bonus_pt_40p
 
     # Rebounds bonus
-    if reb >= 20 and "bonus_reb_20p" in scoring:
-        fpts += scoring["bonus_reb_20p"]
+    if bonus_reb_20p:
+        fpts += (reb >= 20) * bonus_reb_20p
 
     # Assists bonus
-    if ast >= 15 and "bonus_ast_15p" in scoring:
-        fpts += scoring["bonus_ast_15p"]
-
-    # Double-double bonus (2 categories with 10+)
-    categories_10plus = sum([1 for val in [pts, reb, ast, stl, blk] if val >= 10])
-    if categories_10plus >= 2 and "dd" in scoring:
-        fpts += scoring["dd"]
+    if bonus_ast_15p:
+        fpts += (ast >= 15) * bonus_ast_15p
 
-    # Triple-double bonus (3 categories with 10+)
-    if categories_10plus >= 3 and "td" in scoring:
-        fpts += scoring["td"]
+    # Double-double (2 categories with 10+) and triple-double (3+) bonuses,
+    # from a single per-row count of 10+ categories
+    if dd or td:
+        categories_10plus = np.count_nonzero(core >= 10, axis=1)
+        if dd:
+            fpts += (categories_10plus >= 2) * dd
+        if td:
+            fpts += (categories_10plus >= 3) * td
 
-    return round(fpts, 1)
+    # Python's round() (correctly rounded) rather than NumPy's scale-and-rint,
+    # which disagrees near ties
+    return pd.Series([round(v, 1) for v in fpts.tolist()], index=games.index)
 
 
 def process_rosters(users: dict, rosters: list, nba_players: dict) -> tuple:
@@ -390,6 +827,7 @@ def get_top_free_agents(nba_players: dict, rostered_ids: set, limit: int = 100)
                 "team": player.get("team"),
                 "position": player.get("position"),
                 "search_rank": search_rank,
+                "stats_id": player.get("stats_id"),
             })
 
     # Sort by search rank
@@ -397,60 +835,135 @@ def get_top_free_agents(nba_players: dict, rostered_ids: set, limit: int = 100)
     return free_agents[:limit]
 
 
-def fetch_game_logs_for_players(players: list, scoring: dict, player_to_team: dict) -> pd.DataFrame:
-    """Fetch game logs for a list of players."""
-    all_games = []
-    total = len(players)
-
-    for i, player in enumerate(players, 1):
-        sleeper_id = player["sleeper_id"]
-        name = player["name"]
-        team = player.get("team", "")
-        team_info = player_to_team.get(sleeper_id, {})
-        fantasy_team = team_info.get("fantasy_team", "FREE_AGENT")
-
-        # Find NBA player ID
-        nba_id = find_nba_player_id(name, team)
-
-        if not nba_id:
-            log(f"  [{i}/{total}] {name} - NBA ID not found, skipping")
+def fetch_game_logs_for_players(players: list, scoring: dict, player_to_team: dict,
+                                team_schedules: dict = None) -> "pd.DataFrame":
+    """Fetch game logs for a list of players.
+
+    New games for all players are fetched with a single LeagueGameLog request;
+    per-player requests (concurrently, NBA_MAX_WORKERS at a time) are only
+    made for players missing from it, or for everyone if it fails.
+
+    When team_schedules is given, players whose NBA team has not played since
+    their cached game log was last refreshed (less GAMELOG_RECHECK_MARGIN, as
+    the refresh date is local and schedule dates are ET) are served from the
+    cache without hitting NBA Stats API.
+    """
+    import pandas as pd
+
+    today_str = datetime.now().strftime("%Y-%m-%d")
+    targets = []  # (player, nba_id, refresh)
+    stats_id_hits = name_match_hits = skipped = 0
+    for player in players:
+        # Find NBA player ID: Sleeper's stats_id first, name matching as fallback
+        nba_id = nba_id_from_stats_id(player.get("stats_id"), player["name"])
+        if nba_id:
+            stats_id_hits += 1
+        else:
+            nba_id = find_nba_player_id(player["name"], player.get("team", ""))
+            if not nba_id:
+                log(f"  {player['name']} - NBA ID not found, skipping")
+                continue
+            name_match_hits += 1
+
+        refresh = True
+        if team_schedules:
+            since = cached_gamelog_since(nba_id)
+            refresh = not since or team_played_since(team_schedules, player.get("team", ""), since, today_str)
+            skipped += not refresh
+        targets.append((player, nba_id, refresh))
+
+    log(f"  Resolved NBA IDs: {stats_id_hits} via Sleeper stats_id, {name_match_hits} via name matching")
+    if skipped:
+        log(f"  {skipped} players' teams have not played since last refresh, using cached game logs")
+
+    # One batch request for everyone who needs new games
+    refresh_ids = [nba_id for _, nba_id, refresh in targets if refresh]
+    league_games = fetch_league_gamelogs(refresh_ids) if refresh_ids else {}
+    if league_games is None:
+        log("  Falling back to per-player game log requests")
+
+    # Build the games table column by column instead of one dict per game
+    columns = {col: [] for col in GAME_COLUMNS if col not in ("fpts", "fpts_per_min")}
+
+    with ThreadPoolExecutor(max_workers=NBA_MAX_WORKERS) as executor:
+        futures = {}
+        for player, nba_id, refresh in targets:
+            player_league_games = league_games.get(nba_id, []) if league_games is not None else None
+            future = executor.submit(fetch_player_gamelog, nba_id, player["name"], refresh, player_league_games)
+            futures[future] = (player, nba_id)
+
+        total = len(futures)
+        for i, future in enumerate(as_completed(futures), 1):
+            player, nba_id = futures[future]
+            games = future.result()
+            sleeper_id = player["sleeper_id"]
+            name = player["name"]
+            team = player.get("team", "")
+            team_info = player_to_team.get(sleeper_id, {})
+            fantasy_team = team_info.get("fantasy_team", "FREE_AGENT")
+
+            log(f"  [{i}/{total}] {name} (NBA ID: {nba_id}) - {len(games)} games")
+
+            n = len(games)
+            columns["player"].extend([name] * n)
+            columns["sleeper_id"].extend([sleeper_id] * n)
+            columns["nba_team"].extend([team] * n)
+            columns["fantasy_team"].extend([fantasy_team] * n)
+            columns["date"].extend(game["GAME_DATE"] for game in games)
+            columns["week"].extend(get_week_number(game["GAME_DATE"]) for game in games)
+            columns["matchup"].extend(game.get("MATCHUP", "") for game in games)
+            columns["minutes"].extend(game.get("MIN", 0) or 0 for game in games)
+            for col, nba_key in GAME_STAT_COLUMNS.items():
+                columns[col].extend(game.get(nba_key, 0) or 0 for game in games)
+
+    if not columns["player"]:
+        return pd.DataFrame(columns=GAME_COLUMNS)
+
+    # Score all games at once rather than row by row
+    df = pd.DataFrame({col: pd.Series(values, dtype=GAME_DTYPES.get(col)) for col, values in columns.items()})
+    df["fpts"] = calculate_fpts(df, scoring)
+    df["fpts_per_min"] = [
+        round(fpts / minutes, 2) if minutes > 0 else 0
+        for fpts, minutes in zip(df["fpts"].tolist(), df["minutes"].tolist())
+    ]
+    return df[GAME_COLUMNS]
+
+
+def write_game_shards(df: "pd.DataFrame") -> int:
+    """Write one games CSV per player, rewriting only shards whose content changed.
+
+    games_index.json maps each sleeper_id to its shard's sha256 and last
+    modified time, so the dashboard can re-download only changed shards.
+    Shards for players no longer in df are removed. Returns the number of
+    shards written.
+    """
+    GAME_SHARDS_DIR.mkdir(parents=True, exist_ok=True)
+    index_path = DASHBOARD_PUBLIC / "games_index.json"
+    old_index = orjson.loads(index_path.read_bytes()) if index_path.exists() else {}
+    now = datetime.now().isoformat(timespec="seconds")
+
+    index = {}
+    written = 0
+    for sleeper_id, player_games in df.groupby("sleeper_id", sort=False):
+        shard_path = GAME_SHARDS_DIR / f"{sleeper_id}.csv"
+        data = player_games.to_csv(index=False).encode()
+        digest = hashlib.sha256(data).hexdigest()
+
+        previous = old_index.get(sleeper_id)
+        if previous and previous["sha256"] == digest and shard_path.exists():
+            index[sleeper_id] = previous
             continue
 
-        log(f"  [{i}/{total}] {name} (NBA ID: {nba_id})...")
+        shard_path.write_bytes(data)
+        index[sleeper_id] = {"sha256": digest, "last_modified": now}
+        written += 1
 
-        games = fetch_player_gamelog(nba_id, name)
+    for shard_path in GAME_SHARDS_DIR.glob("*.csv"):
+        if shard_path.stem not in index:
+            shard_path.unlink()
 
-        for game in games:
-            week = get_week_number(game["GAME_DATE"])
-            fpts = calculate_fpts(game, scoring)
-            minutes = game.get("MIN", 0) or 0
-
-            all_games.append({
-                "player": name,
-                "sleeper_id": sleeper_id,
-                "nba_team": team,
-                "fantasy_team": fantasy_team,
-                "date": game["GAME_DATE"],
-                "week": week,
-                "matchup": game.get("MATCHUP", ""),
-                "minutes": minutes,
-                "fpts": fpts,
-                "fpts_per_min": round(fpts / minutes, 2) if minutes > 0 else 0,
-                "pts": game.get("PTS", 0),
-                "reb": game.get("REB", 0),
-                "ast": game.get("AST", 0),
-                "stl": game.get("STL", 0),
-                "blk": game.get("BLK", 0),
-                "tov": game.get("TOV", 0),
-                "fgm": game.get("FGM", 0),
-                "fga": game.get("FGA", 0),
-                "fg_pct": game.get("FG_PCT", 0),
-                "ftm": game.get("FTM", 0),
-                "fta": game.get("FTA", 0),
-                "fg3m": game.get("FG3M", 0)
-            })
-
-    return pd.DataFrame(all_games)
+    write_json(index_path, index)
+    return written
 
 
 def process_data(quick: bool = False, include_free_agents: bool = False, free_agent_limit: int = 100):
@@ -466,11 +979,16 @@ def process_data(quick: bool = False, include_free_agents: bool = False, free_ag
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     DASHBOARD_PUBLIC.mkdir(parents=True, exist_ok=True)
 
-    # Fetch Sleeper data
-    rosters = fetch_sleeper_rosters()
-    users = fetch_sleeper_users()
-    league = fetch_sleeper_league()
-    nba_players = fetch_sleeper_all_players()
+    # Fetch Sleeper data (in parallel; players/nba is a multi-MB download)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        rosters_future = executor.submit(fetch_sleeper_rosters)
+        users_future = executor.submit(fetch_sleeper_users)
+        league_future = executor.submit(fetch_sleeper_league)
+        players_future = executor.submit(fetch_sleeper_all_players)
+        rosters = rosters_future.result()
+        users = users_future.result()
+        league = league_future.result()
+        nba_players, players_digest = players_future.result()
 
     # Get scoring settings
     scoring = league.get("scoring_settings", {})
@@ -478,27 +996,23 @@ def process_data(quick: bool = False, include_free_agents: bool = False, free_ag
 
     # Save scoring settings
     scoring_path = DASHBOARD_PUBLIC / "scoring.json"
-    with open(scoring_path, "w") as f:
-        json.dump(scoring, f, indent=2)
+    write_json(scoring_path, scoring, indent=True)
     log(f"Saved scoring settings to {scoring_path}")
 
     # Fetch and save NBA schedule
+    nba_schedule = None
     try:
         nba_schedule = fetch_nba_schedule()
         schedule_path = DASHBOARD_PUBLIC / "schedule.json"
-        with open(schedule_path, "w") as f:
-            json.dump(nba_schedule, f)
+        write_json(schedule_path, nba_schedule, precompress=True)
         log(f"Saved NBA schedule to {schedule_path}")
         log(f"  - {len(nba_schedule['teamSchedules'])} teams")
         log(f"  - Week ends: {nba_schedule['weekEnd']}")
     except Exception as e:
         log(f"Warning: Could not fetch NBA schedule: {e}")
 
-    # Save all NBA players (for free agent lookup in frontend)
-    all_players_path = DASHBOARD_PUBLIC / "all_players.json"
-    with open(all_players_path, "w") as f:
-        json.dump(nba_players, f)
-    log(f"Saved all NBA players to {all_players_path}")
+    # Save all NBA players; the full dict stays in memory for this run
+    save_all_players(nba_players, players_digest)
 
     # Process rosters
     roster_data, player_to_team, rostered_ids = process_rosters(users, rosters, nba_players)
@@ -506,8 +1020,7 @@ def process_data(quick: bool = False, include_free_agents: bool = False, free_ag
 
     # Save rosters
     rosters_path = DASHBOARD_PUBLIC / "rosters.json"
-    with open(rosters_path, "w") as f:
-        json.dump(roster_data, f, indent=2)
+    write_json(rosters_path, roster_data, indent=True, precompress=True)
     log(f"Saved rosters to {rosters_path}")
 
     # Fetch and save matchups for all weeks
@@ -519,8 +1032,7 @@ def process_data(quick: bool = False, include_free_agents: bool = False, free_ag
 
         matchups_data = fetch_all_matchups(current_week)
         matchups_path = DASHBOARD_PUBLIC / "matchups.json"
-        with open(matchups_path, "w") as f:
-            json.dump(matchups_data, f, indent=2)
+        write_json(matchups_path, matchups_data, indent=True)
         log(f"Saved matchups to {matchups_path}")
         log(f"  - {len(matchups_data)} weeks of matchup data")
     except Exception as e:
@@ -545,6 +1057,7 @@ def process_data(quick: bool = False, include_free_agents: bool = False, free_ag
                 "sleeper_id": sleeper_id,
                 "name": f"{player_info.get('first_name', '')} {player_info.get('last_name', '')}".strip(),
                 "team": player_info.get("team", ""),
+                "stats_id": player_info.get("stats_id"),
             })
 
     log(f"Will fetch game logs for {len(players_to_fetch)} rostered players")
@@ -557,7 +1070,8 @@ def process_data(quick: bool = False, include_free_agents: bool = False, free_ag
 
     # Fetch game logs
     log(f"Fetching game logs for {len(players_to_fetch)} total players...")
-    df = fetch_game_logs_for_players(players_to_fetch, scoring, player_to_team)
+    team_schedules = nba_schedule["teamSchedules"] if nba_schedule else None
+    df = fetch_game_logs_for_players(players_to_fetch, scoring, player_to_team, team_schedules)
 
     if len(df) > 0:
         # Sort by player, date
@@ -568,9 +1082,9 @@ def process_data(quick: bool = False, include_free_agents: bool = False, free_ag
         df.to_csv(csv_path, index=False)
         log(f"Saved {len(df)} games to {csv_path}")
 
-        # Save backup
+        # Save backup (copy the file rather than serializing twice)
         backup_path = DATA_DIR / f"all_games_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-        df.to_csv(backup_path, index=False)
+        shutil.copyfile(csv_path, backup_path)
         log(f"Saved backup to {backup_path}")
 
         # Summary stats
@@ -581,6 +1095,15 @@ def process_data(quick: bool = False, include_free_agents: bool = False, free_ag
         max_week = 0
         log("Warning: No game data fetched!")
 
+        # Empty games.csv (header only) so it agrees with the cleared shards below
+        csv_path = DASHBOARD_PUBLIC / "games.csv"
+        df.to_csv(csv_path, index=False)
+
+    # Save per-player shards for incremental dashboard reloads (on an empty
+    # run this removes them all, so no shard outlives games.csv)
+    shards_written = write_game_shards(df)
+    log(f"Updated {shards_written} of {df['sleeper_id'].nunique()} player shards in {GAME_SHARDS_DIR}")
+
     # Summary
     log("=" * 60)
     log("Data Refresh Complete!")